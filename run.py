@@ -1,4 +1,6 @@
+import asyncio
+
 from src.chatbot import start_chatbot
 
 if __name__ == "__main__":
-    start_chatbot()
\ No newline at end of file
+    asyncio.run(start_chatbot())
\ No newline at end of file
@@ -1,25 +1,27 @@
 # Built-in libraries
+import asyncio
+import functools
+import importlib
 import os
 import sys
-import subprocess
-import json
-
-# Gemini SDK
-import google.generativeai as genai
+import threading
 
 # Third-party libraries
-from dotenv import load_dotenv
+import orjson
 
 # Local libraries
-from src.console import console, print_ascii_art
+from src.console import console, print_ascii_art, async_input
 from src.context import get_contexts
-from src.gemini import init_gemini, start_chat, send_message
-from src.history import save_chat_to_history, get_history, delete_history
+from src.gemini import init_gemini, start_chat, send_message_async, warm_up
+from src.history import save_chat_to_history, save_turn_to_history, get_history, delete_history
 
 
+@functools.lru_cache(maxsize=1)
 def load_env_vars() -> tuple[str, str]:
     """Load the API key and model name from environment variables.
 
+    The .env file is only parsed on the first call; later calls reuse the result.
+
     Raises:
         ValueError: If API_KEY or MODEL_NAME is not set.
 
@@ -27,9 +29,11 @@ def load_env_vars() -> tuple[str, str]:
         tuple[str, str]: The API key and model name.
     """
     try:
+        from dotenv import load_dotenv
+
         load_dotenv()
-        api_key = os.getenv("API_KEY")
-        model_name = os.getenv("MODEL_NAME")
+        api_key = os.environ.get("API_KEY")
+        model_name = os.environ.get("MODEL_NAME")
         if not api_key or not model_name:
             raise ValueError("API_KEY and MODEL_NAME must be set in .env file or environment variables")
         return api_key, model_name
@@ -46,14 +50,17 @@ def load_configuration() -> dict:
     """
     default_config = {"temperature": 1.0, "max_tokens": 200, "top_k": 40, "top_p": 0.9}
     try:
-        with open("config.json", "r") as file:
-            config = json.load(file)
+        with open("config.json", "rb") as file:
+            config = orjson.loads(file.read())
     except FileNotFoundError:
         console.print("Configuration file not found. Using default values.", style="bold yellow")
         config = default_config
     
     # Merge default config with loaded config
     final_config = {**default_config, **config}
+
+    # Imported lazily and only after the file read, the Gemini SDK is slow to import
+    import google.generativeai as genai
         
     return genai.GenerationConfig(
         max_output_tokens=final_config["max_tokens"],
@@ -63,10 +70,13 @@ def load_configuration() -> dict:
     )
 
 
-def start_chatbot():
+async def start_chatbot():
     """Main function to run the chatbot CLI."""
+    # Import the Gemini SDK in the background while the banner, .env and config are handled
+    threading.Thread(target=importlib.import_module, args=("google.generativeai",), daemon=True).start()
+
     # Clear terminal and print ascii art
-    subprocess.call('clear' if os.name == 'posix' else 'cls', shell=True)
+    console.clear()
     print_ascii_art()
 
     # Load environment variables
@@ -83,7 +93,7 @@ def start_chatbot():
     if history != []:
         console.print("Do you want to continue the previous chat session? (y/n)", style="bold yellow")
         while True:
-            response = console.input("[bold yellow]> [/]")
+            response = await async_input()
             if response.lower() == "n":
                 delete_history()
                 history = []
@@ -102,32 +112,36 @@ def start_chatbot():
             for idx, context in enumerate(contexts):
                 console.print(f"{idx+1}. {context['name']}")
             while True:
-                try:
-                    context_idx = int(console.input("[bold yellow]> [/]")) - 1
-                    if 0 <= context_idx < len(contexts):
-                        break
-                    else:
-                        console.print("Invalid context index. Please try again.", style="bold red")
-                except ValueError:
+                raw = (await async_input()).strip()
+                if not raw.isdecimal():
                     console.print("Invalid input. Please enter a number.", style="bold red")
+                    continue
+                context_idx = int(raw) - 1
+                if 0 <= context_idx < len(contexts):
+                    break
+                console.print("Invalid context index. Please try again.", style="bold red")
             selected_context = contexts[context_idx]
             history = [{"role": "user", "parts": [selected_context["context"]]}]
             save_chat_to_history("context", "user", selected_context["context"])
     
     # Start a new chat session
     chat = start_chat(model, history)
+
+    # Establish the connection while the user types their first prompt
+    warm_up_task = asyncio.create_task(warm_up(model))
         
     console.print("Hi, how can I assist you today? Feel free to ask anything! (Type '!exit' to quit)", style="bold cyan")
     
     while True:
         # Accept user's next message, add to context, resubmit context to Gemini
-        prompt = console.input("[bold yellow]> [/]")
+        prompt = await async_input()
         if prompt.lower() == "!exit":
             console.print("Goodbye!", style="bold cyan")
+            warm_up_task.cancel()
             break
         
         if prompt:
-            # Save prompt to history file
-            save_chat_to_history("prompt", "user", prompt)
+            response = await send_message_async(chat, prompt)
             
-            send_message(chat, prompt)
+            # Save the prompt and its response to history together
+            save_turn_to_history(prompt, response)
@@ -1,18 +1,89 @@
+# Built-in libraries
+import asyncio
+import sys
+import threading
+
 # Third-party libraries
 from rich.console import Console
+from rich.text import Text
 
 # Initialize rich console
 console = Console()
 
+# Input prompt, chosen once so Rich is bypassed on every turn: bold yellow ANSI codes on a
+# color terminal, plain text when piped, under NO_COLOR or on legacy Windows consoles
+if console.is_terminal and not console.no_color and not console.legacy_windows:
+    PROMPT = "\x1b[1;33m> \x1b[0m"
+else:
+    PROMPT = "> "
 
-def print_ascii_art():
-    """Print ASCII art for the chatbot CLI."""
-    ascii_art = """
+# Banner printed at startup, styled once instead of on every print
+_ASCII_ART = Text(r"""
    ___                 __        _   ___ 
   / __|___ _ __  _ __  \_\_     /_\ |_ _|
  | (__/ _ \ '  \| '_ \/ _` |   / _ \ | | 
   \___\___/_|_|_| .__/\__,_|  /_/ \_\___|
                 |_|                      
                         
-    """    
-    console.print(ascii_art, style="bold magenta", highlight=False)
\ No newline at end of file
+    """, style="bold magenta")
+
+
+def print_ascii_art():
+    """Print ASCII art for the chatbot CLI."""
+    console.print(_ASCII_ART)
+
+
+def _read_line(prompt: str) -> str:
+    """Read a line from stdin without holding the buffered stdin lock.
+
+    A daemon thread blocked inside sys.stdin.readline() keeps that lock, which aborts the
+    interpreter at shutdown. input() only bypasses it when both stdin and stdout are
+    terminals, in every other case the line is read from the unbuffered raw stream.
+    """
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        return input(prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.buffer.raw.readline()
+    if not line:
+        raise EOFError
+    return line.decode(sys.stdin.encoding).rstrip("\r\n")
+
+
+async def async_input(prompt: str = PROMPT) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    The read runs on a daemon thread rather than the default executor, which is
+    joined at shutdown and would keep the process alive on Ctrl-C until Enter is pressed.
+
+    Args:
+        prompt (str): The prompt written before reading.
+
+    Returns:
+        str: The line entered by the user.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(line, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+
+    def read():
+        try:
+            line, error = _read_line(prompt), None
+        except Exception as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, line, error)
+        except RuntimeError:
+            # The event loop is already closed, nobody is waiting for this line
+            pass
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
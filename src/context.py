@@ -1,13 +1,17 @@
 # Built-in libraries
-import json
+import functools
 
+# Third-party libraries
+import orjson
 
+
+@functools.lru_cache(maxsize=1)
 def get_contexts():
-    """Load the chat contexts from the contexts.json file."""
+    """Load the chat contexts from the contexts.json file, read once per process."""
     try:
-        with open("contexts.json", "r") as file:
-            contexts = json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open("contexts.json", "rb") as file:
+            contexts = orjson.loads(file.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         contexts = None
     
     return contexts
@@ -1,17 +1,36 @@
 # Built-in libraries
+import asyncio
+import functools
 import sys
-import json
-
-# Gemini SDK
-import google.generativeai as genai
-
-# Third-party libraries
-from rich.markdown import Markdown
-from rich.panel import Panel
 
 # Local libraries
 from src.console import console
-from src.history import save_chat_to_history
+
+# Delay in seconds between two renders of a streamed response
+REFRESH_INTERVAL = 0.1
+
+# API key the Gemini SDK is currently configured with
+_configured_api_key = None
+
+
+def _build_model(model_name: str, generation_config: dict):
+    """Build a new generative model."""
+    import google.generativeai as genai
+
+    return genai.GenerativeModel(
+        model_name, 
+        generation_config = generation_config
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(api_key: str, model_name: str, config_key: tuple, loop):
+    """Build a model, once per API key, model name, configuration and event loop.
+
+    A model keeps the clients it creates on first use, which are bound to the API key
+    configured at that time and, for the async client, to the running event loop.
+    """
+    return _build_model(model_name, dict(config_key))
 
 
 def init_gemini(api_key: str, model_name: str, config):
@@ -20,18 +39,37 @@ def init_gemini(api_key: str, model_name: str, config):
     Args:
         api_key (str): The API key for Gemini.
         model_name (str): The name of the model to use.
-        config (dict): Configuration parameters for the model.
+        config (dict | GenerationConfig): Configuration parameters for the model.
 
     Returns:
-        GenerativeModel: The initialized generative model.
+        GenerativeModel: The initialized generative model, reused for identical arguments.
     """
+    # Imported lazily, the Gemini SDK is slow to import
+    import google.generativeai as genai
+
+    global _configured_api_key
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel(
-            model_name, 
-            generation_config = config
-        )
-        return model
+        # Only (re)configure the SDK when the API key changes
+        if api_key != _configured_api_key:
+            genai.configure(api_key=api_key)
+            _configured_api_key = api_key
+
+        # Unset fields are left to the SDK defaults
+        params = config if isinstance(config, dict) else vars(config)
+        params = {k: v for k, v in params.items() if v is not None}
+        config_key = tuple(sorted(params.items()))
+        try:
+            hash(config_key)
+        except TypeError:
+            # Values such as stop sequences or a response schema can't be cached
+            return _build_model(model_name, params)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        return _get_model(api_key, model_name, config_key, loop)
     except Exception as e:
         console.print(f"Error initializing Gemini: {e}", style="bold red")
         sys.exit(1)
@@ -54,22 +92,61 @@ def start_chat(model, history):
         sys.exit(1) 
         
 
-def send_message(chat, prompt):
-    """Send user message to Gemini and print the response.
+async def warm_up(model):
+    """Open the connection to Gemini ahead of the first prompt.
+
+    Args:
+        model (GenerativeModel): The generative model to warm up.
+    """
+    try:
+        await model.count_tokens_async("warmup")
+    except Exception:
+        # The first prompt will simply pay for the handshake itself
+        pass
+
+
+async def send_message_async(chat, prompt):
+    """Send user message to Gemini asynchronously and print the response.
 
     Args:
         chat (ChatSession): The chat session.
         prompt (str): The user's message.
+
+    Returns:
+        str: The full response text.
     """
+    from rich.live import Live
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     try:
         # Send user entry to Gemini and read the response in stream
-        with console.status("[bold cyan]Thinking...[/bold cyan]", spinner="dots"):
-            response = chat.send_message(prompt)
-        
-        # Save chat response to history
-        save_chat_to_history("response", "model", response.text)
-        
-        console.print(Panel(Markdown(response.text)))
+        response_stream = await chat.send_message_async(prompt, stream=True)
+
+        # Render chunks as they arrive, the refresh thread re-parses the markdown at most
+        # once per interval and only when new text came in
+        buf = ""
+        panel, panel_len = Panel(Markdown("")), 0
+
+        def render():
+            nonlocal panel, panel_len
+            if panel_len != len(buf):
+                panel, panel_len = Panel(Markdown(buf)), len(buf)
+            return panel
+
+        with Live(console=console, get_renderable=render, refresh_per_second=1 / REFRESH_INTERVAL):
+            async for chunk in response_stream:
+                # .text raises ValueError on chunks without parts, such as an empty final
+                # chunk, skip them so the text received so far is kept
+                try:
+                    buf += chunk.text
+                except ValueError:
+                    continue
+
+        # Finalize the response so the chat history is updated
+        await response_stream.resolve()
+
+        return buf
     except Exception as e:
         console.print(f"Error during chat interaction: {e}", style="bold red")
         sys.exit(1)
@@ -1,49 +1,158 @@
 # Built-in libraries
-import json
+import atexit
+import os
+import queue
+import threading
+
+# Third-party libraries
+import orjson
 
 # Local libraries
 from src.console import console
 
+HISTORY_FILE = "history.jsonl"
+LEGACY_HISTORY_FILE = "history.json"
+
+# In-memory copy of the history, loaded once from disk by get_history
+_HISTORY_CACHE: list[dict] = None
+
+# Entries waiting to be appended to disk by the background writer
+_write_q = queue.Queue()
+
+
+def migrate_legacy_history():
+    """Convert the old indented history.json file into the history.jsonl format."""
+    if os.path.exists(HISTORY_FILE) or not os.path.exists(LEGACY_HISTORY_FILE):
+        return
 
-def get_history():
-    """Load the chat history from the history.json file."""
     try:
-        with open("history.json", "r") as file:
-            history = json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(LEGACY_HISTORY_FILE, "rb") as file:
+            history = orjson.loads(file.read())
+    except orjson.JSONDecodeError:
         history = []
-    
-    return history
+    except Exception as e:
+        console.print(f"Error migrating history: {e}", style="bold red")
+        return
+
+    try:
+        with open(HISTORY_FILE, "wb") as file:
+            for entry in history:
+                file.write(orjson.dumps(entry) + b"\n")
+        os.remove(LEGACY_HISTORY_FILE)
+    except Exception as e:
+        console.print(f"Error migrating history: {e}", style="bold red")
+
+
+def _repair_history_tail(size, last_line_start):
+    """Terminate the last line of the history.jsonl file if it is valid, otherwise drop it."""
+    try:
+        with open(HISTORY_FILE, "r+b") as file:
+            file.seek(last_line_start)
+            try:
+                orjson.loads(file.read())
+            except orjson.JSONDecodeError:
+                file.truncate(last_line_start)
+            else:
+                file.seek(size)
+                file.write(b"\n")
+    except Exception as e:
+        console.print(f"Error repairing history: {e}", style="bold red")
+
+
+def get_history():
+    """Load the chat history from the history.jsonl file."""
+    global _HISTORY_CACHE
+
+    if _HISTORY_CACHE is None:
+        migrate_legacy_history()
+        _HISTORY_CACHE = []
+        try:
+            with open(HISTORY_FILE, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            data = b""
+        except Exception as e:
+            console.print(f"Error loading history: {e}", style="bold red")
+            data = b""
+
+        # Skip undecodable lines instead of dropping the whole history
+        for line in data.splitlines():
+            if line:
+                try:
+                    _HISTORY_CACHE.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+
+        # A write interrupted by a crash leaves a partial last line, cut it off so the
+        # next append starts on a fresh line
+        if data and not data.endswith(b"\n"):
+            _repair_history_tail(len(data), data.rfind(b"\n") + 1)
+
+    return _HISTORY_CACHE
 
 
 def delete_history():
-    """Delete the chat history from the history.json file."""
+    """Delete the chat history from the history.jsonl file."""
+    global _HISTORY_CACHE
+
+    # Let pending writes land first so they are not appended after the truncate
+    _write_q.join()
+
+    _HISTORY_CACHE = []
     try:
-        with open("history.json", "w") as file:
-            file.write("[]")
+        with open(HISTORY_FILE, "wb"):
+            pass
     except Exception as e:
         console.print(f"Error deleting history: {e}", style="bold red")
 
 
+def _writer_loop():
+    """Append queued history entries to the history.jsonl file in batches."""
+    while True:
+        batch = [_write_q.get()]
+        try:
+            while True:
+                batch.append(_write_q.get_nowait())
+        except queue.Empty:
+            pass
+
+        try:
+            with open(HISTORY_FILE, "ab") as file:
+                file.write(b"".join(orjson.dumps(entry) + b"\n" for entries in batch for entry in entries))
+        except Exception as e:
+            console.print(f"Error saving history: {e}", style="bold red")
+        finally:
+            for _ in batch:
+                _write_q.task_done()
+
+
 def save_chat_to_history(type, role, content):
-    """Save the user's prompt to the history.json file."""
-    import json
-    
-    history_file = "history.json"
+    """Queue a chat entry to be appended to the history.jsonl file."""
+    entry = {"role": role, "parts": [content]}
     try:
-        # Load existing history
-        try:
-            with open(history_file, "r") as file:
-                history = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            history = []
+        get_history().append(entry)
+        _write_q.put([entry])
+    except Exception as e:
+        console.print(f"Error saving {type} to history: {e}", style="bold red")
 
-        # Append new string to history
-        history.append({"role": role, "parts": [content]})
 
-        # Save updated history
-        with open(history_file, "w") as file:
-            json.dump(history, file, indent=4)
+def save_turn_to_history(prompt, response):
+    """Queue a prompt and its response to be appended to the history.jsonl file in a single write.
 
+    Saving both together means the file never holds a prompt without its response.
+    """
+    entries = [
+        {"role": "user", "parts": [prompt]},
+        {"role": "model", "parts": [response]},
+    ]
+    try:
+        get_history().extend(entries)
+        _write_q.put(entries)
     except Exception as e:
-        console.print(f"Error saving {type} to history: {e}", style="bold red")
\ No newline at end of file
+        console.print(f"Error saving chat turn to history: {e}", style="bold red")
+
+
+threading.Thread(target=_writer_loop, daemon=True).start()
+
+# Flush pending writes before the interpreter exits
+atexit.register(_write_q.join)